@@ -60,6 +60,14 @@ from .debug_info import info
     default=200000,  # this default is here for performance reasons
     help="Chunk reading/writing SQL records",
 )
+@click.option(
+    "-W",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Transfer this many tables in parallel using separate processes. "
+    "Defaults to 1.",
+)
 @click.option("-l", "--log-file", type=click.Path(), help="Log file")
 @click.option(
     "-V",
@@ -92,6 +100,7 @@ def cli(
     skip_ssl,
     no_case,
     chunk,
+    workers,
     log_file,
     vacuum,
     use_buffered_cursors,
@@ -112,6 +121,7 @@ def cli(
             mysql_ssl_disabled=skip_ssl,
             no_case_flag=no_case,
             chunk=chunk,
+            workers=workers,
             vacuum=vacuum,
             buffered=use_buffered_cursors,
             log_file=log_file,
@@ -0,0 +1,6 @@
+"""MySQL helpers."""
+
+
+def quote_mysql_identifier(identifier):
+    """Quote a MySQL identifier, escaping any embedded backticks."""
+    return "`{}`".format(identifier.replace("`", "``"))
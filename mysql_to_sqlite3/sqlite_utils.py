@@ -1,8 +1,5 @@
 """SQLite adapters and converters for unsupported data types."""
 
-from __future__ import division
-
-import sqlite3
 from datetime import timedelta
 from decimal import Decimal
 
@@ -31,9 +28,16 @@ def convert_timedelta(value):
     return timedelta(seconds=timeparse(value))
 
 
-def encode_data_for_sqlite(value):
-    """Fix encoding bytes."""
-    try:
-        return value.decode()
-    except (UnicodeDecodeError, AttributeError):
-        return sqlite3.Binary(value)
+def encode_set_for_sqlite(value, members):
+    """Convert a MySQL SET to its comma separated string representation.
+
+    The members are listed in the order they were defined in, like MySQL does.
+    """
+    if isinstance(value, set):
+        return ",".join(member for member in members if member in value)
+    return value
+
+
+def quote_identifier(identifier):
+    """Quote an SQLite identifier, escaping any embedded double quotes."""
+    return '"{}"'.format(identifier.replace('"', '""'))
@@ -1,38 +1,85 @@
 """Use to transfer a MySQL database to SQLite."""
 
-from __future__ import division
-
 import logging
 import re
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
 from datetime import timedelta
 from decimal import Decimal
-from math import ceil
-from os.path import realpath
+from functools import partial
+from itertools import chain
+from os import remove
+from os.path import isfile, realpath
+from queue import Queue
 from sys import stdout
+from threading import Event, Thread
 
 import mysql.connector
-import six
-from mysql.connector import errorcode
-from tqdm import tqdm, trange
+from mysql.connector import FieldFlag, HAVE_CEXT, errorcode
+from tqdm import tqdm
 
+from mysql_to_sqlite3.mysql_utils import quote_mysql_identifier
 from mysql_to_sqlite3.sqlite_utils import (
     adapt_decimal,
     adapt_timedelta,
     convert_decimal,
     convert_timedelta,
-    encode_data_for_sqlite,
+    encode_set_for_sqlite,
+    quote_identifier,
 )
 
-if six.PY2:
-    from .sixeptions import *  # pylint: disable=W0401
-
 
 class MySQLtoSQLite:
     """Use this class to transfer a MySQL database to SQLite."""
 
     COLUMN_PATTERN = re.compile(r"^[^(]+")
     COLUMN_LENGTH_PATTERN = re.compile(r"\(\d+\)$")
+    SET_MEMBER_PATTERN = re.compile(r"'((?:[^']|'')*)'")
+
+    TYPE_MAP = {
+        "BIGINT": "BIGINT",
+        "BLOB": "BLOB",
+        "BOOLEAN": "BOOLEAN",
+        "DATE": "DATE",
+        "DATETIME": "DATETIME",
+        "DECIMAL": "DECIMAL",
+        "DOUBLE": "DOUBLE",
+        "FLOAT": "FLOAT",
+        "INTEGER": "INTEGER",
+        "MEDIUMINT": "MEDIUMINT",
+        "NUMERIC": "NUMERIC",
+        "REAL": "REAL",
+        "SMALLINT": "SMALLINT",
+        "TIME": "TIME",
+        "TINYINT": "TINYINT",
+        "YEAR": "YEAR",
+        "BIT": "BLOB",
+        "BINARY": "BLOB",
+        "LONGBLOB": "BLOB",
+        "MEDIUMBLOB": "BLOB",
+        "TINYBLOB": "BLOB",
+        "VARBINARY": "BLOB",
+        "INT": "INTEGER",
+        "TIMESTAMP": "DATETIME",
+    }
+
+    # types that keep their length suffix, e.g. VARCHAR(255)
+    LENGTH_TYPE_MAP = {
+        "CHAR": "CHARACTER",
+        "NCHAR": "NCHAR",
+        "NVARCHAR": "NVARCHAR",
+        "VARCHAR": "VARCHAR",
+    }
+
+    # commit and start a new SQLite transaction once this many bytes were written
+    SQLITE_TRANSACTION_SIZE = 64 * 1024 * 1024
+
+    # the lowest default of SQLITE_MAX_VARIABLE_NUMBER across SQLite versions
+    SQLITE_MAX_VARIABLE_NUMBER = 999
+
+    _CR_SERVER_LOST = errorcode.CR_SERVER_LOST
+    _ER_BAD_DB_ERROR = errorcode.ER_BAD_DB_ERROR
 
     def __init__(self, **kwargs):
         """Constructor."""
@@ -70,7 +117,14 @@ class MySQLtoSQLite:
         
         self.no_case_flag = kwargs.get("no_case_flag") or False
 
-        self._current_chunk_number = 0
+        self._column_type_cache = {}
+
+        # single column primary keys by table, used for keyset pagination
+        self._primary_keys = {}
+
+        # members of the SET columns by table, in the order they were defined in
+        self._set_members = {}
+
         self._chunk_size = int(kwargs.get("chunk")) if kwargs.get("chunk") else None
 
         self._sqlite_file = kwargs.get("sqlite_file") or None
@@ -79,8 +133,22 @@ class MySQLtoSQLite:
 
         self._vacuum = kwargs.get("vacuum") or False
 
+        self._sqlite_page_size = int(kwargs.get("sqlite_page_size") or 32768)
+
+        # 0 disables memory-mapped I/O
+        self._sqlite_mmap_size = (
+            int(kwargs.get("sqlite_mmap_size"))
+            if kwargs.get("sqlite_mmap_size") is not None
+            else 1024 * 1024 * 1024
+        )
+
         self._quiet = kwargs.get("quiet") or False
 
+        self._workers = int(kwargs.get("workers") or 1)
+
+        # kept so that worker processes can open their own connections
+        self._options = kwargs
+
         self._logger = self._setup_logger(
             log_file=kwargs.get("log_file") or None, quiet=self._quiet
         )
@@ -91,12 +159,23 @@ class MySQLtoSQLite:
         sqlite3.register_converter("TIME", convert_timedelta)
 
         self._sqlite = sqlite3.connect(
-            realpath(self._sqlite_file), detect_types=sqlite3.PARSE_DECLTYPES
+            realpath(self._sqlite_file),
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            cached_statements=256,
         )
-        self._sqlite.row_factory = sqlite3.Row
 
         self._sqlite_cur = self._sqlite.cursor()
 
+        # tune SQLite for a single-writer bulk load; the page size can not be
+        # changed anymore once the database is in WAL mode
+        self._sqlite_cur.execute(f"PRAGMA page_size={self._sqlite_page_size}")
+        self._sqlite_cur.execute(f"PRAGMA mmap_size={self._sqlite_mmap_size}")
+        self._sqlite_cur.execute("PRAGMA journal_mode=WAL")
+        self._sqlite_cur.execute("PRAGMA synchronous=OFF")
+        self._sqlite_cur.execute("PRAGMA temp_store=MEMORY")
+        self._sqlite_cur.execute("PRAGMA cache_size=-262144")
+
         try:
             self._mysql = mysql.connector.connect(
                 user=self._mysql_user,
@@ -104,11 +183,12 @@ class MySQLtoSQLite:
                 host=self._mysql_host,
                 port=self._mysql_port,
                 ssl_disabled=self._mysql_ssl_disabled,
+                use_pure=not HAVE_CEXT,
             )
             if not self._mysql.is_connected():
                 raise ConnectionError("Unable to connect to MySQL")
 
-            self._mysql_cur = self._mysql.cursor(buffered=self._buffered, raw=True)
+            self._mysql_cur = self._mysql.cursor(buffered=self._buffered)
             self._mysql_cur_prepared = self._mysql.cursor(prepared=True)
             self._mysql_cur_dict = self._mysql.cursor(
                 buffered=self._buffered,
@@ -117,7 +197,7 @@ class MySQLtoSQLite:
             try:
                 self._mysql.database = self._mysql_database
             except (mysql.connector.Error, Exception) as err:
-                if hasattr(err, "errno") and err.errno == errorcode.ER_BAD_DB_ERROR:
+                if hasattr(err, "errno") and err.errno == self._ER_BAD_DB_ERROR:
                     self._logger.error("MySQL Database does not exist!")
                     raise
                 self._logger.error(err)
@@ -165,7 +245,6 @@ class MySQLtoSQLite:
         except (UnicodeDecodeError, AttributeError):
             pass
 
-        # This could be optimized even further, however is seems adequate.
         match = cls._valid_column_type(column_type)
         if not match:
             raise ValueError("Invalid column_type!")
@@ -177,44 +256,25 @@ class MySQLtoSQLite:
             
         no_case_str = 'COLLATE NOCASE' if no_case_flag else ''
             
-        if data_type in {
-            "BIGINT",
-            "BLOB",
-            "BOOLEAN",
-            "DATE",
-            "DATETIME",
-            "DECIMAL",
-            "DOUBLE",
-            "FLOAT",
-            "INTEGER",
-            "MEDIUMINT",
-            "NUMERIC",
-            "REAL",
-            "SMALLINT",
-            "TIME",
-            "TINYINT",
-            "YEAR",
-        }:
-            return data_type, ''
-        if data_type in {
-            "BIT",
-            "BINARY",
-            "LONGBLOB",
-            "MEDIUMBLOB",
-            "TINYBLOB",
-            "VARBINARY",
-        }:
-            return "BLOB", ''
-        if data_type in {"NCHAR", "NVARCHAR", "VARCHAR"}:
-            return data_type + cls._column_type_length(column_type), no_case_str
-        if data_type == "CHAR":
-            return "CHARACTER" + cls._column_type_length(column_type), no_case_str
-        if data_type == "INT":
-            return "INTEGER", ''
-        if data_type in "TIMESTAMP":
-            return "DATETIME", ''
+        length_type = cls.LENGTH_TYPE_MAP.get(data_type)
+        if length_type is not None:
+            return length_type + cls._column_type_length(column_type), no_case_str
+        sqlite_type = cls.TYPE_MAP.get(data_type)
+        if sqlite_type is not None:
+            return sqlite_type, ""
         return "TEXT", no_case_str
 
+    def _translate_column_type(self, column_type):
+        """Translate a column type, parsing every distinct type only once."""
+        try:
+            return self._column_type_cache[column_type]
+        except KeyError:
+            translation = self._translate_type_from_mysql_to_sqlite(
+                column_type, self.no_case_flag
+            )
+            self._column_type_cache[column_type] = translation
+            return translation
+
     @classmethod
     def _translate_default_from_mysql_to_sqlite(
         cls, column_default=None, column_type=None
@@ -232,12 +292,7 @@ class MySQLtoSQLite:
                     return "DEFAULT(TRUE)"
                 return "DEFAULT(FALSE)"
             return "DEFAULT '{}'".format(int(column_default))
-        if (
-            six.PY2
-            and isinstance(
-                column_default, unicode  # noqa: ignore=F405 pylint: disable=E0602
-            )
-        ) or isinstance(column_default, str):
+        if isinstance(column_default, str):
             if column_default.upper() in {
                 "CURRENT_TIME",
                 "CURRENT_DATE",
@@ -246,23 +301,93 @@ class MySQLtoSQLite:
                 return "DEFAULT {}".format(column_default.upper())
         return "DEFAULT '{}'".format(column_default)
 
+    @classmethod
+    def _column_converters(cls, description, set_members):
+        """Return a converter for every column SQLite is unable to bind natively."""
+        return tuple(
+            partial(encode_set_for_sqlite, members=set_members[column[0]])
+            if column[7] & FieldFlag.SET
+            else None
+            for column in description
+        )
+
+    @staticmethod
+    def _compile_row_converter(converters):
+        """Generate a function converting a whole row with every column inlined.
+
+        Columns without a converter are passed through as they are.
+        """
+        namespace = {
+            f"convert_{index}": converter
+            for index, converter in enumerate(converters)
+            if converter is not None
+        }
+        values = "".join(
+            f"row[{index}], "
+            if converter is None
+            else f"None if row[{index}] is None else convert_{index}(row[{index}]), "
+            for index, converter in enumerate(converters)
+        )
+        exec(f"def convert_row(row):\n    return ({values})", namespace)  # nosec
+        return namespace["convert_row"]
+
+    @classmethod
+    def _build_insert_sql(cls, table_name, columns, rows=1):
+        fields = ", ".join(quote_identifier(column) for column in columns)
+        placeholders = ", ".join("?" * len(columns))
+        values = ", ".join([f"({placeholders})"] * rows)
+        return f"""
+            INSERT OR IGNORE
+            INTO {quote_identifier(table_name)} ({fields})
+            VALUES {values}
+        """
+
+    def _insert_rows(self, rows, sql, bulk_sql=None, rows_per_statement=1):
+        """Insert rows using as many multi-row INSERT statements as possible."""
+        bulk_count = len(rows) - len(rows) % rows_per_statement if bulk_sql else 0
+        for offset in range(0, bulk_count, rows_per_statement):
+            self._sqlite_cur.execute(
+                bulk_sql,
+                tuple(chain.from_iterable(rows[offset : offset + rows_per_statement])),
+            )
+        if bulk_count < len(rows):
+            self._sqlite_cur.executemany(sql, rows[bulk_count:])
+
+    def _sqlite_size(self):
+        """Return the size of the SQLite database, including uncommitted pages."""
+        page_count = self._sqlite_cur.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._sqlite_cur.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
     def _build_create_table_sql(self, table_name):
-        sql = 'CREATE TABLE IF NOT EXISTS "{}" ('.format(table_name)
-        primary = ""
-        indices = ""
+        definitions = []
+        unique_indices = []
+        indices = []
 
-        self._mysql_cur_dict.execute("SHOW COLUMNS FROM `{}`".format(table_name))
+        self._mysql_cur_dict.execute(
+            f"SHOW COLUMNS FROM {quote_mysql_identifier(table_name)}"
+        )
 
+        set_members = self._set_members[table_name] = {}
         for row in self._mysql_cur_dict.fetchall():
-            column_type, no_case_str = self._translate_type_from_mysql_to_sqlite(row["Type"], self.no_case_flag)
-            sql += '\n\t"{name}" {type} {notnull} {no_case} {default},'.format(
-                name=row["Field"],
-                type=column_type,
-                notnull="NULL" if row["Null"] == "YES" else "NOT NULL",
-                default=self._translate_default_from_mysql_to_sqlite(
-                    row["Default"], column_type
-                ),
-                no_case=no_case_str,
+            # MySQL 8 returns the column type as bytes
+            try:
+                mysql_type = row["Type"].decode()
+            except (UnicodeDecodeError, AttributeError):
+                mysql_type = row["Type"]
+            if mysql_type.lower().startswith("set("):
+                set_members[row["Field"]] = tuple(
+                    member.replace("''", "'")
+                    for member in self.SET_MEMBER_PATTERN.findall(mysql_type)
+                )
+            name = quote_identifier(row["Field"])
+            column_type, no_case_str = self._translate_column_type(mysql_type)
+            notnull = "NULL" if row["Null"] == "YES" else "NOT NULL"
+            default = self._translate_default_from_mysql_to_sqlite(
+                row["Default"], column_type
+            )
+            definitions.append(
+                f"{name} {column_type} {notnull} {no_case_str} {default}"
             )
 
         self._mysql_cur_dict.execute(
@@ -278,27 +403,35 @@ class MySQLtoSQLite:
             """,
             (self._mysql_database, table_name),
         )
+        primary_key = None
         for index in self._mysql_cur_dict.fetchall():
+            columns = ", ".join(
+                quote_identifier(column) for column in index["columns"].split(",")
+            )
             if int(index["primary"]) == 1:
-                primary += "\n\tPRIMARY KEY ({columns})".format(
-                    columns=", ".join(
-                        '"{}"'.format(column) for column in index["columns"].split(",")
-                    )
-                )
+                primary_key = f"PRIMARY KEY ({columns})"
+                if "," not in index["columns"]:
+                    self._primary_keys[table_name] = index["columns"]
             else:
-                indices += """CREATE {unique} INDEX IF NOT EXISTS "{name}" ON "{table}" ({columns});""".format(
-                    unique="UNIQUE" if int(index["unique"]) == 1 else "",
-                    # combine the index name with the table name in order to
-                    # make the index names unique across the database
-                    name="{table}_{name}".format(table=table_name, name=index["name"]),
-                    table=table_name,
-                    columns=", ".join(
-                        '"{}"'.format(column) for column in index["columns"].split(",")
-                    ),
-                )
+                # combine the index name with the table name in order to
+                # make the index names unique across the database
+                name = quote_identifier(f"{table_name}_{index['name']}")
+                # unique indices are created along with the table so that
+                # INSERT OR IGNORE skips the rows violating them; the others
+                # are only created once the data is in place
+                if int(index["unique"]) == 1:
+                    unique_indices.append(
+                        f"CREATE UNIQUE INDEX IF NOT EXISTS {name} "
+                        f"ON {quote_identifier(table_name)} ({columns});"
+                    )
+                else:
+                    indices.append(
+                        f"CREATE INDEX IF NOT EXISTS {name} "
+                        f"ON {quote_identifier(table_name)} ({columns});"
+                    )
 
-        sql += primary
-        sql = sql.rstrip(", ")
+        if primary_key:
+            definitions.append(primary_key)
 
         if not self._without_foreign_keys:
             server_version = self._mysql.get_server_version()
@@ -331,101 +464,233 @@ class MySQLtoSQLite:
                 (self._mysql_database, table_name, "FOREIGN KEY"),
             )
             for foreign_key in self._mysql_cur_dict.fetchall():
-                sql += """,\n\tFOREIGN KEY("{column}") REFERENCES "{ref_table}" ("{ref_column}") ON UPDATE {on_update} ON DELETE {on_delete}""".format(
-                    **foreign_key
+                definitions.append(
+                    f"FOREIGN KEY({quote_identifier(foreign_key['column'])}) "
+                    f"REFERENCES {quote_identifier(foreign_key['ref_table'])} "
+                    f"({quote_identifier(foreign_key['ref_column'])}) "
+                    f"ON UPDATE {foreign_key['on_update']} "
+                    f"ON DELETE {foreign_key['on_delete']}"
                 )
 
-        sql += "\n);"
-        sql += indices
-        
-        return sql
+        definitions = ",\n\t".join(definitions)
+        return (
+            f"CREATE TABLE IF NOT EXISTS {quote_identifier(table_name)} "
+            f"(\n\t{definitions}\n);" + "".join(unique_indices),
+            indices,
+        )
 
-    def _create_table(self, table_name, attempting_reconnect=False):
+    def _with_mysql_retry(self, func, *args, **kwargs):
+        """Call func, reconnecting once to MySQL should the connection be lost."""
         try:
-            if attempting_reconnect:
-                self._mysql.reconnect()
-            self._sqlite_cur.executescript(self._build_create_table_sql(table_name))
-            self._sqlite.commit()
+            return func(*args, **kwargs)
         except mysql.connector.Error as err:
-            if err.errno == errorcode.CR_SERVER_LOST:
-                if not attempting_reconnect:
-                    self._logger.warning(
-                        "Connection to MySQL server lost." "\nAttempting to reconnect."
-                    )
-                    self._create_table(table_name, True)
-                else:
-                    self._logger.warning(
-                        "Connection to MySQL server lost."
-                        "\nReconnection attempt aborted."
-                    )
-                    raise
-            self._logger.error(
-                "MySQL failed reading table definition from table %s: %s",
-                table_name,
-                err,
+            if err.errno != self._CR_SERVER_LOST:
+                raise
+            self._logger.warning(
+                "Connection to MySQL server lost." "\nAttempting to reconnect."
+            )
+        self._mysql.reconnect()
+        try:
+            return func(*args, **kwargs)
+        except mysql.connector.Error as err:
+            if err.errno == self._CR_SERVER_LOST:
+                self._logger.warning(
+                    "Connection to MySQL server lost." "\nReconnection attempt aborted."
+                )
+            raise
+
+    def _create_tables(self, table_names):
+        """Create all the tables in a single script and return their indices."""
+        try:
+            definitions = self._with_mysql_retry(
+                lambda: [
+                    self._build_create_table_sql(table_name)
+                    for table_name in table_names
+                ]
             )
+            script = "".join(sql for sql, _ in definitions)
+            self._sqlite_cur.executescript(f"BEGIN;{script}COMMIT;")
+            return {
+                table_name: indices
+                for table_name, (_, indices) in zip(table_names, definitions)
+            }
+        except mysql.connector.Error as err:
+            if err.errno != self._CR_SERVER_LOST:
+                self._logger.error("MySQL failed reading table definitions: %s", err)
             raise
         except sqlite3.Error as err:
-            self._logger.error("SQLite failed creating table %s: %s", table_name, err)
+            if self._sqlite.in_transaction:
+                self._sqlite.rollback()
+            self._logger.error("SQLite failed creating tables: %s", err)
             raise
 
+    def _create_indices(self, table_name, indices):
+        try:
+            self._sqlite_cur.executescript("".join(indices))
+        except sqlite3.Error as err:
+            self._logger.error(
+                "SQLite failed creating indices on table %s: %s", table_name, err
+            )
+            raise
+
+    def _check_foreign_keys(self, table_names):
+        """Report the rows violating foreign keys that were not enforced on load."""
+        for table_name in table_names:
+            try:
+                violations = self._sqlite_cur.execute(
+                    f"PRAGMA foreign_key_check({quote_identifier(table_name)})"
+                ).fetchall()
+            except sqlite3.OperationalError as err:
+                # e.g. a foreign key referencing columns that are neither
+                # the primary key nor covered by a unique index
+                self._logger.warning(
+                    "Unable to check the foreign keys of table %s: %s", table_name, err
+                )
+                continue
+            for _, rowid, parent, _ in violations:
+                self._logger.warning(
+                    "Row %s of table %s violates a foreign key referencing table %s",
+                    rowid,
+                    table_name,
+                    parent,
+                )
+
+    def _fetch_chunks(self, pages, chunks, stop, errors):
+        try:
+            for rows in pages:
+                if stop.is_set():
+                    break
+                chunks.put(rows)
+        except Exception as err:  # pylint: disable=W0703
+            errors.append(err)
+        finally:
+            chunks.put(None)
+
+    def _iter_pages(self, table_name, primary_key, key_index, last_key=None):
+        """Read a table page by page, ordered by its single column primary key.
+
+        Every page is a separate query, so no result set is kept open on the
+        MySQL server in between and reading can resume after the last key.
+        """
+        table = quote_mysql_identifier(table_name)
+        key = quote_mysql_identifier(primary_key)
+        first_page = f"SELECT * FROM {table} ORDER BY {key} LIMIT %s"
+        next_page = f"SELECT * FROM {table} WHERE {key} > %s ORDER BY {key} LIMIT %s"
+        while True:
+            if last_key is None:
+                self._mysql_cur.execute(first_page, (self._chunk_size,))
+            else:
+                self._mysql_cur.execute(next_page, (last_key, self._chunk_size))
+            rows = self._mysql_cur.fetchall()
+            if rows:
+                yield rows
+            if len(rows) < self._chunk_size:
+                break
+            last_key = rows[-1][key_index]
+
+    def _iter_chunks(self, pages):
+        """Yield chunks of rows prefetched from MySQL by a background thread.
+
+        This overlaps reading from MySQL with writing to SQLite.
+        """
+        # keep only a few chunks in memory ahead of the SQLite writer
+        chunks = Queue(maxsize=4)
+        stop = Event()
+        errors = []
+        producer = Thread(target=self._fetch_chunks, args=(pages, chunks, stop, errors))
+        producer.daemon = True
+        producer.start()
+        exhausted = False
+        try:
+            while True:
+                rows = chunks.get()
+                if rows is None:
+                    exhausted = True
+                    break
+                yield rows
+        finally:
+            if not exhausted:
+                # the consumer bailed out early; unblock and stop the producer
+                stop.set()
+                while chunks.get() is not None:
+                    pass
+            producer.join()
+        if errors:
+            raise errors[0]
+
     def _transfer_table_data(
-        self, table_name, sql, total_records=0, attempting_reconnect=False
+        self,
+        table_name,
+        sql,
+        bulk_sql=None,
+        rows_per_statement=1,
+        primary_key=None,
     ):
-        if attempting_reconnect:
-            self._mysql.reconnect()
-        try:
+        # every query resets the description of the cursor, so take what is
+        # needed from it before any page is read
+        columns = [column[0] for column in self._mysql_cur.description]
+        converters = self._column_converters(
+            self._mysql_cur.description, self._set_members.get(table_name, {})
+        )
+        convert_row = (
+            self._compile_row_converter(converters) if any(converters) else None
+        )
+        # with keyset pagination the rows written before a lost connection
+        # are kept and a retry resumes after the last one
+        last_key = None
+        key_index = columns.index(primary_key) if primary_key is not None else None
+
+        def transfer_rows(progress, key_index):
+            nonlocal last_key
             if self._chunk_size is not None and self._chunk_size > 0:
-                for chunk in trange(
-                    self._current_chunk_number,
-                    int(ceil(total_records / self._chunk_size)),
-                    disable=self._quiet,
-                ):
-                    self._current_chunk_number = chunk
-                    self._sqlite_cur.executemany(
-                        sql,
-                        (
-                            tuple(
-                                encode_data_for_sqlite(col) if col is not None else None
-                                for col in row
-                            )
-                            for row in self._mysql_cur.fetchmany(self._chunk_size)
-                        ),
+                # bound the size of a transaction by the amount of data written
+                # rather than by the number of rows, which varies with row width
+                transaction_start = self._sqlite_size()
+                if primary_key is not None:
+                    pages = self._iter_pages(
+                        table_name, primary_key, key_index, last_key
                     )
+                else:
+                    pages = iter(
+                        partial(self._mysql_cur.fetchmany, self._chunk_size), []
+                    )
+                with closing(self._iter_chunks(pages)) as chunks:
+                    for rows in chunks:
+                        self._insert_rows(
+                            list(map(convert_row, rows)) if convert_row else rows,
+                            sql,
+                            bulk_sql,
+                            rows_per_statement,
+                        )
+                        progress.update(len(rows))
+                        if primary_key is not None:
+                            last_key = rows[-1][key_index]
+                        if (
+                            self._sqlite_size() - transaction_start
+                            >= self.SQLITE_TRANSACTION_SIZE
+                        ):
+                            self._sqlite.commit()
+                            self._sqlite_cur.execute("BEGIN")
+                            transaction_start = self._sqlite_size()
             else:
-                self._sqlite_cur.executemany(
+                rows = self._mysql_cur.fetchall()
+                self._insert_rows(
+                    list(map(convert_row, rows)) if convert_row else rows,
                     sql,
-                    (
-                        tuple(
-                            encode_data_for_sqlite(col) if col is not None else None
-                            for col in row
-                        )
-                        for row in tqdm(
-                            self._mysql_cur.fetchall(),
-                            total=total_records,
-                            disable=self._quiet,
-                        )
-                    ),
+                    bulk_sql,
+                    rows_per_statement,
                 )
-            self._sqlite.commit()
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.CR_SERVER_LOST:
-                if not attempting_reconnect:
-                    self._logger.warning(
-                        "Connection to MySQL server lost." "\nAttempting to reconnect."
-                    )
-                    self._transfer_table_data(
-                        table_name=table_name,
-                        sql=sql,
-                        total_records=total_records,
-                        attempting_reconnect=True,
-                    )
+                progress.update(len(rows))
+
+        try:
+            with tqdm(desc=table_name, unit=" rows", disable=self._quiet) as progress:
+                if primary_key is not None:
+                    self._with_mysql_retry(transfer_rows, progress, key_index)
                 else:
-                    self._logger.warning(
-                        "Connection to MySQL server lost."
-                        "\nReconnection attempt aborted."
-                    )
-                    raise
+                    # a lost result set can not be resumed without a key to resume
+                    # from, and reading it again would duplicate the rows written
+                    transfer_rows(progress, key_index)
+        except mysql.connector.Error as err:
             self._logger.error(
                 "MySQL transfer failed reading table data from table %s: %s",
                 table_name,
@@ -440,6 +705,135 @@ class MySQLtoSQLite:
             )
             raise
 
+    def _transfer_table(self, table_name):
+        primary_key = (
+            self._primary_keys.get(table_name)
+            if self._chunk_size is not None and self._chunk_size > 0
+            else None
+        )
+        if primary_key is not None:
+            # the rows are read page by page later on; only the columns are needed
+            self._mysql_cur.execute(
+                f"SELECT * FROM {quote_mysql_identifier(table_name)} LIMIT 0"
+            )
+            self._mysql_cur.fetchall()
+        else:
+            self._mysql_cur.execute(
+                f"SELECT * FROM {quote_mysql_identifier(table_name)}"
+            )
+        columns = [column[0] for column in self._mysql_cur.description]
+        # build the SQL strings, binding as many rows per statement
+        # as the SQLite variable limit allows
+        rows_per_statement = max(1, self.SQLITE_MAX_VARIABLE_NUMBER // len(columns))
+        sql = self._build_insert_sql(table_name, columns)
+        bulk_sql = (
+            self._build_insert_sql(table_name, columns, rows=rows_per_statement)
+            if rows_per_statement > 1
+            else None
+        )
+        # accumulate all the chunks of a table in a single transaction
+        self._sqlite_cur.execute("BEGIN")
+        try:
+            self._transfer_table_data(
+                table_name=table_name,
+                sql=sql,
+                bulk_sql=bulk_sql,
+                rows_per_statement=rows_per_statement,
+                primary_key=primary_key,
+            )
+        except Exception:
+            self._sqlite.rollback()
+            raise
+        self._sqlite.commit()
+
+    def _transfer_tables_in_parallel(self, tables):
+        """Transfer each table into its own SQLite file in a worker process.
+
+        The part files are merged into the main SQLite database as soon as
+        their worker is done and removed afterwards.
+        """
+        options = dict(
+            self._options,
+            without_foreign_keys=True,
+            vacuum=False,
+            quiet=True,
+            log_file=None,
+            workers=1,
+        )
+        part_files = {}
+        try:
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = {}
+                for index, table_name in enumerate(tables):
+                    self._logger.info("Transferring table %s", table_name)
+                    part_files[table_name] = (
+                        f"{realpath(self._sqlite_file)}.part{index}"
+                    )
+                    # never merge the leftovers of an interrupted run
+                    self._remove_sqlite_file(part_files[table_name])
+                    future = executor.submit(
+                        self._transfer_table_part,
+                        dict(
+                            options,
+                            sqlite_file=part_files[table_name],
+                            mysql_tables=[table_name],
+                        ),
+                        table_name,
+                    )
+                    futures[future] = table_name
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        self._merge_table_part(
+                            futures[future], part_files[futures[future]]
+                        )
+                except Exception:
+                    # do not wait for the tables that were not started yet
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            for part_file in part_files.values():
+                self._remove_sqlite_file(part_file)
+
+    @classmethod
+    def _transfer_table_part(cls, options, table_name):
+        """Transfer a single table into its own SQLite file; runs in a worker."""
+        transporter = cls(**options)
+        try:
+            transporter._create_tables([table_name])  # pylint: disable=W0212
+            transporter._transfer_table(table_name)  # pylint: disable=W0212
+        finally:
+            transporter._sqlite.close()  # pylint: disable=W0212
+            transporter._mysql.close()  # pylint: disable=W0212
+
+    def _merge_table_part(self, table_name, part_file):
+        quoted_table_name = quote_identifier(table_name)
+        self._sqlite_cur.execute("ATTACH DATABASE ? AS part", (part_file,))
+        try:
+            self._sqlite_cur.execute("BEGIN")
+            try:
+                self._sqlite_cur.execute(
+                    f"INSERT OR IGNORE INTO main.{quoted_table_name} "
+                    f"SELECT * FROM part.{quoted_table_name}"
+                )
+            except sqlite3.Error as err:
+                self._sqlite.rollback()
+                self._logger.error(
+                    "SQLite failed merging table %s: %s", table_name, err
+                )
+                raise
+            self._sqlite.commit()
+        finally:
+            self._sqlite_cur.execute("DETACH DATABASE part")
+        self._remove_sqlite_file(part_file)
+
+    @staticmethod
+    def _remove_sqlite_file(sqlite_file):
+        for path in (sqlite_file, f"{sqlite_file}-wal", f"{sqlite_file}-shm"):
+            if isfile(path):
+                remove(path)
+
     def transfer(self):
         """The primary and only method with which we transfer all the data."""
         if len(self._mysql_tables) > 0:
@@ -456,7 +850,7 @@ class MySQLtoSQLite:
                 ),
                 self._mysql_tables,
             )
-            tables = (row[0] for row in self._mysql_cur_prepared.fetchall())
+            tables = [row[0] for row in self._mysql_cur_prepared.fetchall()]
         else:
             # transfer all tables
             self._mysql_cur.execute(
@@ -466,48 +860,38 @@ class MySQLtoSQLite:
                 WHERE TABLE_SCHEMA = SCHEMA()
             """
             )
-            tables = (row[0].decode() for row in self._mysql_cur.fetchall())
+            tables = [row[0] for row in self._mysql_cur.fetchall()]
 
         try:
-            # turn off foreign key checking in SQLite while transferring data
+            # turn off foreign key and CHECK constraint enforcement in SQLite
+            # while transferring data
             self._sqlite_cur.execute("PRAGMA foreign_keys=OFF")
+            self._sqlite_cur.execute("PRAGMA ignore_check_constraints=ON")
 
-            for table_name in tables:
-                # reset the chunk
-                self._current_chunk_number = 0
-
-                # create the table
-                self._create_table(table_name)
-
-                # get the size of the data
-                self._mysql_cur_dict.execute(
-                    "SELECT COUNT(*) AS `total_records` FROM `{}`".format(table_name)
-                )
-                total_records = int(self._mysql_cur_dict.fetchone()["total_records"])
+            # create all the tables up front; their non-unique indices are only
+            # created once the data is in place so SQLite does not have to update
+            # them on every insert
+            indices = self._create_tables(tables)
 
-                # only continue if there is anything to transfer
-                if total_records > 0:
+            if self._workers > 1 and len(tables) > 1:
+                self._transfer_tables_in_parallel(tables)
+            else:
+                for table_name in tables:
                     # populate it
                     self._logger.info("Transferring table %s", table_name)
-                    self._mysql_cur.execute("SELECT * FROM `{}`".format(table_name))
-                    columns = [column[0] for column in self._mysql_cur.description]
-                    # build the SQL string
-                    sql = """
-                        INSERT OR IGNORE
-                        INTO "{table}" ({fields})
-                        VALUES ({placeholders})
-                    """.format(
-                        table=table_name,
-                        fields=('"{}", ' * len(columns)).rstrip(" ,").format(*columns),
-                        placeholders=("?, " * len(columns)).rstrip(" ,"),
-                    )
-                    self._transfer_table_data(
-                        table_name=table_name, sql=sql, total_records=total_records
-                    )
+                    self._transfer_table(table_name)
+
+            for table_name in tables:
+                if indices[table_name]:
+                    self._create_indices(table_name, indices[table_name])
+
+            if not self._without_foreign_keys:
+                self._check_foreign_keys(tables)
         except Exception:  # pylint: disable=W0706
             raise
         finally:
-            # re-enable foreign key checking once done transferring
+            # re-enable constraint checking once done transferring
+            self._sqlite_cur.execute("PRAGMA ignore_check_constraints=OFF")
             self._sqlite_cur.execute("PRAGMA foreign_keys=ON")
 
         if self._vacuum:
@@ -516,4 +900,8 @@ class MySQLtoSQLite:
             )
             self._sqlite_cur.execute("VACUUM")
 
+        # WAL is only meant for the load; do not leave it set in the output file
+        self._sqlite_cur.execute("PRAGMA journal_mode=DELETE")
+        self._sqlite.close()
+
         self._logger.info("Done!")
@@ -8,18 +8,12 @@ here = abspath(dirname(__file__))
 packages = ["mysql_to_sqlite3"]
 
 requires = [
-    "Click>=7.0,<8.0.0 ; python_version<'3.6'",
-    "Click>=7.0 ; python_version>='3.6'",
-    "mysql-connector-python>=8.0.18,<8.0.24 ; python_version<'3.6'",
-    "mysql-connector-python>=8.0.18 ; python_version>='3.6'",
+    "Click>=7.0",
+    "mysql-connector-python>=8.0.18",
     "pytimeparse>=1.1.8",
-    "python-slugify>=3.0.3,<5.0.0 ; python_version<'3.6'",
-    "python-slugify>=3.0.3 ; python_version>='3.6'",
     "simplejson>=3.16.0",
-    "six>=1.12.0",
     "tqdm>=4.35.0",
-    "tabulate<0.8.6 ; python_version<'3.5'",
-    "tabulate ; python_version>='3.5'",
+    "tabulate",
 ]
 
 about = {}
@@ -40,7 +34,7 @@ setup(
     url=about["__url__"],
     packages=packages,
     include_package_data=True,
-    python_requires=">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*",
+    python_requires=">=3.8",
     install_requires=requires,
     license=about["__license__"],
     zip_safe=False,
@@ -53,12 +47,8 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: Implementation :: CPython",
@@ -1,7 +1,7 @@
 import socket
 from codecs import open
 from collections import namedtuple
-from contextlib import contextmanager, closing
+from contextlib import contextmanager
 from os.path import join, abspath, dirname, isfile
 from random import choice
 from string import ascii_uppercase, digits, ascii_lowercase
@@ -10,7 +10,6 @@ from time import sleep
 import docker
 import mysql.connector
 import pytest
-import six
 import json
 from click.testing import CliRunner
 from docker.errors import NotFound
@@ -29,9 +28,6 @@ from .factories import (
     CrazyNameFactory,
 )
 
-if six.PY2:
-    from .sixeptions import *
-
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -142,24 +138,15 @@ def helpers():
 
 @pytest.fixture()
 def sqlite_database(tmpdir):
-    if six.PY2:
-        db_name = "".join(
-            choice(ascii_uppercase + ascii_lowercase + digits) for _ in xrange(32)
-        )
-    else:
-        db_name = "".join(
-            choice(ascii_uppercase + ascii_lowercase + digits) for _ in range(32)
-        )
+    db_name = "".join(
+        choice(ascii_uppercase + ascii_lowercase + digits) for _ in range(32)
+    )
     return str(tmpdir.join("{}.sqlite3".format(db_name)))
 
 
 def is_port_in_use(port, host="0.0.0.0"):
-    if six.PY2:
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-            return s.connect_ex((host, port)) == 0
-    else:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex((host, port)) == 0
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex((host, port)) == 0
 
 
 @pytest.fixture(scope="session")
@@ -294,104 +281,51 @@ def mysql_instance(mysql_credentials, pytestconfig):
         container.kill()
 
 
-if six.PY2:
-
-    @pytest.fixture(scope="session")
-    def mysql_database(tmpdir_factory, mysql_instance, mysql_credentials, faker):
-        temp_image_dir = tmpdir_factory.mktemp("images")
-
-        db = Database(
-            "mysql+mysqldb://{user}:{password}@{host}:{port}/{database}".format(
-                user=mysql_credentials.user,
-                password=mysql_credentials.password,
-                host=mysql_credentials.host,
-                port=mysql_credentials.port,
-                database=mysql_credentials.database,
-            )
-        )
-
-        with Helpers.session_scope(db) as session:
-            for _ in range(faker.pyint(min_value=12, max_value=24)):
-                article = ArticleFactory()
-                article.authors.append(AuthorFactory())
-                article.tags.append(TagFactory())
-                article.misc.append(MiscFactory())
-                for _ in range(faker.pyint(min_value=1, max_value=4)):
-                    article.images.append(
-                        ImageFactory(
-                            path=join(
-                                str(temp_image_dir),
-                                faker.year(),
-                                faker.month(),
-                                faker.day_of_month(),
-                                faker.file_name(extension="jpg"),
-                            )
-                        )
-                    )
-                session.add(article)
-
-            for _ in range(faker.pyint(min_value=12, max_value=24)):
-                session.add(CrazyNameFactory())
-            try:
-                session.commit()
-            except IntegrityError:
-                session.rollback()
-
-        yield db
-
-        if database_exists(db.engine.url):
-            drop_database(db.engine.url)
-
-
-else:
-
-    @pytest.fixture(scope="session")
-    def mysql_database(
-        tmpdir_factory, mysql_instance, mysql_credentials, _session_faker
-    ):
-        temp_image_dir = tmpdir_factory.mktemp("images")
-
-        db = Database(
-            "mysql+mysqldb://{user}:{password}@{host}:{port}/{database}".format(
-                user=mysql_credentials.user,
-                password=mysql_credentials.password,
-                host=mysql_credentials.host,
-                port=mysql_credentials.port,
-                database=mysql_credentials.database,
-            )
+@pytest.fixture(scope="session")
+def mysql_database(tmpdir_factory, mysql_instance, mysql_credentials, _session_faker):
+    temp_image_dir = tmpdir_factory.mktemp("images")
+
+    db = Database(
+        "mysql+mysqldb://{user}:{password}@{host}:{port}/{database}".format(
+            user=mysql_credentials.user,
+            password=mysql_credentials.password,
+            host=mysql_credentials.host,
+            port=mysql_credentials.port,
+            database=mysql_credentials.database,
         )
+    )
 
-        with Helpers.session_scope(db) as session:
-            for _ in range(_session_faker.pyint(min_value=12, max_value=24)):
-                article = ArticleFactory()
-                article.authors.append(AuthorFactory())
-                article.tags.append(TagFactory())
-                article.misc.append(MiscFactory())
-                for _ in range(_session_faker.pyint(min_value=1, max_value=4)):
-                    article.images.append(
-                        ImageFactory(
-                            path=join(
-                                str(temp_image_dir),
-                                _session_faker.year(),
-                                _session_faker.month(),
-                                _session_faker.day_of_month(),
-                                _session_faker.file_name(extension="jpg"),
-                            )
+    with Helpers.session_scope(db) as session:
+        for _ in range(_session_faker.pyint(min_value=12, max_value=24)):
+            article = ArticleFactory()
+            article.authors.append(AuthorFactory())
+            article.tags.append(TagFactory())
+            article.misc.append(MiscFactory())
+            for _ in range(_session_faker.pyint(min_value=1, max_value=4)):
+                article.images.append(
+                    ImageFactory(
+                        path=join(
+                            str(temp_image_dir),
+                            _session_faker.year(),
+                            _session_faker.month(),
+                            _session_faker.day_of_month(),
+                            _session_faker.file_name(extension="jpg"),
                         )
                     )
-                session.add(article)
+                )
+            session.add(article)
 
-            for _ in range(_session_faker.pyint(min_value=12, max_value=24)):
-                session.add(CrazyNameFactory())
-            try:
-                session.commit()
-            except IntegrityError:
-                session.rollback()
+        for _ in range(_session_faker.pyint(min_value=12, max_value=24)):
+            session.add(CrazyNameFactory())
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
 
-        yield db
+    yield db
 
-        if database_exists(db.engine.url):
-            drop_database(db.engine.url)
+    if database_exists(db.engine.url):
+        drop_database(db.engine.url)
 
 
 @pytest.fixture()
@@ -54,6 +54,9 @@ class MiscFactory(factory.Factory):
     time_field = factory.Faker("time_object")
     varbinary_field = factory.Faker("binary", length=255)
     varchar_field = factory.Faker("text", max_nb_chars=255)
+    set_field = factory.Faker(
+        "random_elements", elements=models.SET_FIELD_MEMBERS, unique=True
+    )
     timestamp_field = factory.Faker("date_time_this_century")
 
 
@@ -7,14 +7,20 @@ from random import choice, sample
 import mysql.connector
 import pytest
 import simplejson as json
-import six
 from mysql.connector import errorcode, MySQLConnection
 from sqlalchemy import MetaData, Table, select, create_engine, inspect, text
 
 from mysql_to_sqlite3 import MySQLtoSQLite
+from ..models import SET_FIELD_MEMBERS
 
-if six.PY2:
-    from ..sixeptions import *
+
+def normalize_mysql_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, set):
+        # SQLite holds SET values as strings listing the members in definition order
+        return ",".join(member for member in SET_FIELD_MEMBERS if member in value)
+    return value
 
 
 @pytest.mark.usefixtures("mysql_instance")
@@ -226,26 +232,42 @@ class TestMySQLtoSQLite:
 
     @pytest.mark.transfer
     @pytest.mark.parametrize(
-        "chunk, vacuum, buffered",
+        "chunk, vacuum, buffered, workers",
         [
             # 000
             pytest.param(
-                None, False, False, id="no chunk, no vacuum, no buffered cursor"
+                None, False, False, 1, id="no chunk, no vacuum, no buffered cursor"
             ),
             # 111
-            pytest.param(10, True, True, id="chunk, vacuum, buffered cursor"),
+            pytest.param(10, True, True, 1, id="chunk, vacuum, buffered cursor"),
             # 110
-            pytest.param(10, True, False, id="chunk, vacuum, no buffered cursor"),
+            pytest.param(10, True, False, 1, id="chunk, vacuum, no buffered cursor"),
             # 011
-            pytest.param(None, True, True, id="no chunk, vacuum, buffered cursor"),
+            pytest.param(None, True, True, 1, id="no chunk, vacuum, buffered cursor"),
             # 010
-            pytest.param(None, True, False, id="no chunk, vacuum, no buffered cursor"),
+            pytest.param(
+                None, True, False, 1, id="no chunk, vacuum, no buffered cursor"
+            ),
             # 100
-            pytest.param(10, False, False, id="chunk, no vacuum, no buffered cursor"),
+            pytest.param(
+                10, False, False, 1, id="chunk, no vacuum, no buffered cursor"
+            ),
             # 001
-            pytest.param(None, False, True, id="no chunk, no vacuum, buffered cursor"),
+            pytest.param(
+                None, False, True, 1, id="no chunk, no vacuum, buffered cursor"
+            ),
             # 101
-            pytest.param(10, False, True, id="chunk, no vacuum, buffered cursor"),
+            pytest.param(10, False, True, 1, id="chunk, no vacuum, buffered cursor"),
+            pytest.param(
+                10,
+                False,
+                False,
+                2,
+                id="chunk, no vacuum, no buffered cursor, 2 workers",
+            ),
+            pytest.param(
+                None, True, True, 2, id="no chunk, vacuum, buffered cursor, 2 workers"
+            ),
         ],
     )
     def test_transfer_transfers_all_tables_from_mysql_to_sqlite(
@@ -258,6 +280,7 @@ class TestMySQLtoSQLite:
         chunk,
         vacuum,
         buffered,
+        workers,
     ):
         proc = MySQLtoSQLite(
             sqlite_file=sqlite_database,
@@ -269,6 +292,7 @@ class TestMySQLtoSQLite:
             chunk=chunk,
             vacuum=vacuum,
             buffered=buffered,
+            workers=workers,
         )
         caplog.set_level(logging.DEBUG)
         proc.transfer()
@@ -321,6 +345,9 @@ class TestMySQLtoSQLite:
         )
         server_version = mysql_connector_connection.get_server_version()
 
+        """ Test if the SQLite database was left out of WAL mode """
+        assert sqlite_cnx.execute("PRAGMA journal_mode").scalar() == "delete"
+
         """ Test if both databases have the same table names """
         assert sqlite_tables == mysql_tables
 
@@ -420,8 +447,7 @@ class TestMySQLtoSQLite:
             mysql_result = mysql_cnx.execute(mysql_stmt).fetchall()
             mysql_result.sort()
             mysql_result = [
-                [float(data) if isinstance(data, Decimal) else data for data in row]
-                for row in mysql_result
+                [normalize_mysql_value(data) for data in row] for row in mysql_result
             ]
             mysql_results.append(mysql_result)
 
@@ -475,10 +501,7 @@ class TestMySQLtoSQLite:
         mysql_inspect = inspect(mysql_engine)
         mysql_tables = mysql_inspect.get_table_names()
 
-        if six.PY2:
-            table_number = choice(xrange(1, len(mysql_tables)))
-        else:
-            table_number = choice(range(1, len(mysql_tables)))
+        table_number = choice(range(1, len(mysql_tables)))
 
         random_mysql_tables = sample(mysql_tables, table_number)
         random_mysql_tables.sort()
@@ -570,8 +593,7 @@ class TestMySQLtoSQLite:
             mysql_result = mysql_cnx.execute(mysql_stmt).fetchall()
             mysql_result.sort()
             mysql_result = [
-                [float(data) if isinstance(data, Decimal) else data for data in row]
-                for row in mysql_result
+                [normalize_mysql_value(data) for data in row] for row in mysql_result
             ]
             mysql_results.append(mysql_result)
 
@@ -1,7 +1,6 @@
 from random import choice, sample
 
 import pytest
-import six
 from sqlalchemy import create_engine, inspect
 
 from mysql_to_sqlite3 import MySQLtoSQLite
@@ -161,10 +160,7 @@ class TestMySQLtoSQLite:
     def test_invalid_database_port(
         self, cli_runner, sqlite_database, mysql_database, mysql_credentials, faker
     ):
-        if six.PY2:
-            port = choice(xrange(2, 2 ** 16 - 1))
-        else:
-            port = choice(range(2, 2 ** 16 - 1))
+        port = choice(range(2, 2 ** 16 - 1))
         if port == mysql_credentials.port:
             port -= 1
         result = cli_runner.invoke(
@@ -330,6 +326,50 @@ class TestMySQLtoSQLite:
         else:
             assert result.output != ""
 
+    @pytest.mark.parametrize(
+        "workers", [pytest.param(1, id="1 worker"), pytest.param(2, id="2 workers")]
+    )
+    def test_workers(
+        self, cli_runner, sqlite_database, mysql_database, mysql_credentials, workers
+    ):
+        result = cli_runner.invoke(
+            mysql2sqlite,
+            [
+                "-f",
+                sqlite_database,
+                "-d",
+                mysql_credentials.database,
+                "-u",
+                mysql_credentials.user,
+                "--mysql-password",
+                mysql_credentials.password,
+                "-h",
+                mysql_credentials.host,
+                "-P",
+                mysql_credentials.port,
+                "-W",
+                workers,
+            ],
+        )
+        assert result.exit_code == 0
+
+    def test_invalid_workers(self, cli_runner, sqlite_database, mysql_credentials):
+        result = cli_runner.invoke(
+            mysql2sqlite,
+            [
+                "-f",
+                sqlite_database,
+                "-d",
+                mysql_credentials.database,
+                "-u",
+                mysql_credentials.user,
+                "-W",
+                0,
+            ],
+        )
+        assert result.exit_code > 0
+        assert "Invalid value" in result.output
+
     def test_keyboard_interrupt(
         self, cli_runner, sqlite_database, mysql_credentials, mysql_database, mocker
     ):
@@ -369,10 +409,7 @@ class TestMySQLtoSQLite:
         mysql_inspect = inspect(mysql_engine)
         mysql_tables = mysql_inspect.get_table_names()
 
-        if six.PY2:
-            table_number = choice(xrange(1, len(mysql_tables)))
-        else:
-            table_number = choice(range(1, len(mysql_tables)))
+        table_number = choice(range(1, len(mysql_tables)))
 
         result = cli_runner.invoke(
             mysql2sqlite,
@@ -409,10 +446,8 @@ class TestMySQLtoSQLite:
                 "SQLite",
                 "click",
                 "mysql-connector-python",
-                "python-slugify",
                 "pytimeparse",
                 "simplejson",
-                "six",
                 "tabulate",
                 "tqdm",
             }
@@ -26,13 +26,23 @@ from sqlalchemy import (
     VARBINARY,
     VARCHAR,
 )
-from sqlalchemy.dialects.mysql import BIGINT, INTEGER, MEDIUMINT, SMALLINT, TINYINT
+from sqlalchemy.dialects.mysql import (
+    BIGINT,
+    INTEGER,
+    MEDIUMINT,
+    SET,
+    SMALLINT,
+    TINYINT,
+)
 from sqlalchemy.sql.functions import current_timestamp
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, backref
 
 Base = declarative_base()
 
+# deliberately not in alphabetical order, with a member containing a quote
+SET_FIELD_MEMBERS = ("small", "large", "it's")
+
 
 class Author(Base):
     __tablename__ = "authors"
@@ -122,6 +132,7 @@ class Misc(Base):
     time_field = Column(Time, nullable=True)
     varbinary_field = Column(VARBINARY(255), nullable=True)
     varchar_field = Column(VARCHAR(255), nullable=True)
+    set_field = Column(SET(*SET_FIELD_MEMBERS), nullable=True)
     timestamp_field = Column(TIMESTAMP, default=current_timestamp())
     dupe = Column(Boolean, index=True, default=False)
 
@@ -1,5 +1,8 @@
 import logging
 import sqlite3
+import threading
+from functools import partial
+from itertools import count
 from random import choice
 
 import mysql.connector
@@ -9,6 +12,8 @@ from sqlalchemy import inspect
 from sqlalchemy.dialects.mysql import __all__ as mysql_column_types
 
 from mysql_to_sqlite3 import MySQLtoSQLite
+from mysql_to_sqlite3.mysql_utils import quote_mysql_identifier
+from mysql_to_sqlite3.sqlite_utils import encode_set_for_sqlite, quote_identifier
 
 
 class TestMySQLtoSQLiteClassmethods:
@@ -214,6 +219,41 @@ class TestMySQLtoSQLiteClassmethods:
             == sqlite_default_translation
         )
 
+    def test_compile_row_converter(self):
+        convert_row = MySQLtoSQLite._compile_row_converter(
+            (None, partial(encode_set_for_sqlite, members=("small", "large")), None)
+        )
+        assert convert_row((1, {"large", "small"}, b"\x00")) == (
+            1,
+            "small,large",
+            b"\x00",
+        )
+        assert convert_row((1, None, None)) == (1, None, None)
+
+    @pytest.mark.parametrize(
+        "identifier, quoted",
+        [
+            pytest.param("articles", '"articles"', id="plain"),
+            pytest.param("crazy name", '"crazy name"', id="space"),
+            pytest.param('say "hi"', '"say ""hi"""', id="double quotes"),
+            pytest.param("say `hi`", '"say `hi`"', id="backticks"),
+        ],
+    )
+    def test_quote_identifier(self, identifier, quoted):
+        assert quote_identifier(identifier) == quoted
+
+    @pytest.mark.parametrize(
+        "identifier, quoted",
+        [
+            pytest.param("articles", "`articles`", id="plain"),
+            pytest.param("crazy name", "`crazy name`", id="space"),
+            pytest.param('say "hi"', '`say "hi"`', id="double quotes"),
+            pytest.param("say `hi`", "`say ``hi```", id="backticks"),
+        ],
+    )
+    def test_quote_mysql_identifier(self, identifier, quoted):
+        assert quote_mysql_identifier(identifier) == quoted
+
 
 @pytest.mark.exceptions
 @pytest.mark.usefixtures("mysql_instance")
@@ -257,7 +297,7 @@ class TestMySQLtoSQLiteSQLExceptions:
         mocker.patch.object(proc, "_sqlite", FakeSQLiteConnector())
         caplog.set_level(logging.DEBUG)
         with pytest.raises(mysql.connector.Error):
-            proc._create_table(choice(mysql_tables))
+            proc._create_tables([choice(mysql_tables)])
 
     @pytest.mark.parametrize(
         "quiet",
@@ -291,7 +331,7 @@ class TestMySQLtoSQLiteSQLExceptions:
         mocker.patch.object(proc, "_sqlite_cur", FakeSQLiteCursor())
         caplog.set_level(logging.DEBUG)
         with pytest.raises(mysql.connector.Error):
-            proc._create_table(choice(mysql_tables))
+            proc._create_tables([choice(mysql_tables)])
 
     @pytest.mark.parametrize(
         "quiet",
@@ -322,7 +362,128 @@ class TestMySQLtoSQLiteSQLExceptions:
         mocker.patch.object(proc, "_sqlite_cur", FakeSQLiteCursor())
         caplog.set_level(logging.DEBUG)
         with pytest.raises(sqlite3.Error):
-            proc._create_table(choice(mysql_tables))
+            proc._create_tables([choice(mysql_tables)])
+
+    def test_with_mysql_retry_reconnects_once(
+        self, sqlite_database, mysql_credentials, mocker, caplog
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+        func = mocker.Mock(
+            side_effect=[
+                mysql.connector.Error(
+                    msg="Error Code: 2013. Lost connection to MySQL server during query",
+                    errno=errorcode.CR_SERVER_LOST,
+                ),
+                "result",
+            ]
+        )
+        reconnect = mocker.patch.object(proc._mysql, "reconnect", return_value=True)
+        caplog.set_level(logging.DEBUG)
+        assert proc._with_mysql_retry(func, "argument", keyword="value") == "result"
+        reconnect.assert_called_once()
+        assert func.call_count == 2
+        func.assert_called_with("argument", keyword="value")
+        assert any(
+            "Attempting to reconnect" in record.message for record in caplog.records
+        )
+
+    def test_with_mysql_retry_aborts_after_one_reconnect(
+        self, sqlite_database, mysql_credentials, mocker, caplog
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+        func = mocker.Mock(
+            side_effect=mysql.connector.Error(
+                msg="Error Code: 2013. Lost connection to MySQL server during query",
+                errno=errorcode.CR_SERVER_LOST,
+            )
+        )
+        reconnect = mocker.patch.object(proc._mysql, "reconnect", return_value=True)
+        caplog.set_level(logging.DEBUG)
+        with pytest.raises(mysql.connector.Error):
+            proc._with_mysql_retry(func)
+        reconnect.assert_called_once()
+        assert func.call_count == 2
+        assert any(
+            "Reconnection attempt aborted" in record.message
+            for record in caplog.records
+        )
+
+    def test_with_mysql_retry_does_not_retry_other_errors(
+        self, sqlite_database, mysql_credentials, mocker
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+        func = mocker.Mock(
+            side_effect=mysql.connector.Error(
+                msg="Error Code: 2000. Unknown MySQL error",
+                errno=errorcode.CR_UNKNOWN_ERROR,
+            )
+        )
+        reconnect = mocker.patch.object(proc._mysql, "reconnect", return_value=True)
+        with pytest.raises(mysql.connector.Error):
+            proc._with_mysql_retry(func)
+        reconnect.assert_not_called()
+        assert func.call_count == 1
+
+    def test_check_foreign_keys_mismatch(
+        self, sqlite_database, mysql_credentials, caplog
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+        # a composite primary key referenced column by column is a foreign key
+        # mismatch for SQLite
+        proc._sqlite_cur.executescript(
+            """
+            CREATE TABLE "parent" ("a" INTEGER, "b" INTEGER, PRIMARY KEY ("a", "b"));
+            CREATE TABLE "child" (
+                "a" INTEGER,
+                FOREIGN KEY("a") REFERENCES "parent" ("a")
+            );
+            CREATE TABLE "orphan" (
+                "parent_a" INTEGER,
+                FOREIGN KEY("parent_a") REFERENCES "other" ("id")
+            );
+            CREATE TABLE "other" ("id" INTEGER PRIMARY KEY);
+            INSERT INTO "orphan" VALUES (1);
+            """
+        )
+        caplog.set_level(logging.DEBUG)
+        proc._check_foreign_keys(["parent", "child", "orphan", "other"])
+        messages = [record.message for record in caplog.records]
+        assert any(
+            message.startswith("Unable to check the foreign keys of table child")
+            for message in messages
+        )
+        assert (
+            "Row 1 of table orphan violates a foreign key referencing table other"
+            in messages
+        )
 
     @pytest.mark.parametrize(
         "exception, quiet",
@@ -388,6 +549,8 @@ class TestMySQLtoSQLiteSQLExceptions:
         )
 
         class FakeMySQLCursor:
+            description = ()
+
             def fetchall(self):
                 raise exception
 
@@ -412,3 +575,307 @@ class TestMySQLtoSQLiteSQLExceptions:
 
         with pytest.raises((mysql.connector.Error, sqlite3.Error)):
             proc._transfer_table_data(table_name, sql)
+
+
+class FakeKeysetMySQLCursor:
+    DESCRIPTION = (
+        ("id", 3, None, None, None, None, 0, 0),
+        ("name", 253, None, None, None, None, 1, 0),
+    )
+
+    def __init__(self, rows, lose_connection_at=None):
+        self.description = self.DESCRIPTION
+        self.rows = rows
+        self.lose_connection_at = lose_connection_at
+        self.params = []
+        self.result = []
+
+    def execute(self, operation, params=()):
+        # like the connector, reset the result before running the query
+        self.description = None
+        self.params.append(params)
+        if len(self.params) == self.lose_connection_at:
+            raise mysql.connector.Error(
+                msg="Error Code: 2013. Lost connection to MySQL server during query",
+                errno=errorcode.CR_SERVER_LOST,
+            )
+        last_key, limit = params if len(params) == 2 else (None, params[0])
+        self.result = [
+            row for row in self.rows if last_key is None or row[0] > last_key
+        ][:limit]
+        self.description = self.DESCRIPTION
+
+    def fetchall(self):
+        return self.result
+
+
+@pytest.mark.transfer
+@pytest.mark.usefixtures("mysql_instance")
+class TestMySQLtoSQLiteKeysetPagination:
+    @pytest.mark.parametrize(
+        "row_count, page_sizes, params",
+        [
+            pytest.param(0, [], [(5,)], id="empty table"),
+            pytest.param(
+                10,
+                [5, 5],
+                [(5,), (5, 5), (10, 5)],
+                id="exact multiple of the chunk size",
+            ),
+            pytest.param(
+                12, [5, 5, 2], [(5,), (5, 5), (10, 5)], id="last page not full"
+            ),
+        ],
+    )
+    def test_iter_pages(
+        self, sqlite_database, mysql_credentials, mocker, row_count, page_sizes, params
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            chunk=5,
+        )
+        rows = [(key, str(key)) for key in range(1, row_count + 1)]
+        cursor = FakeKeysetMySQLCursor(rows)
+        mocker.patch.object(proc, "_mysql_cur", cursor)
+
+        pages = list(proc._iter_pages("keyset", "id", 0))
+
+        assert [len(page) for page in pages] == page_sizes
+        assert [row for page in pages for row in page] == rows
+        assert cursor.params == params
+
+    def test_iter_pages_resumes_after_last_key(
+        self, sqlite_database, mysql_credentials, mocker
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            chunk=5,
+        )
+        rows = [(key, str(key)) for key in range(1, 13)]
+        cursor = FakeKeysetMySQLCursor(rows)
+        mocker.patch.object(proc, "_mysql_cur", cursor)
+
+        pages = list(proc._iter_pages("keyset", "id", 0, last_key=7))
+
+        assert [row for page in pages for row in page] == rows[7:]
+        assert cursor.params[0] == (7, 5)
+
+    def test_transfer_table_data_resumes_after_lost_connection(
+        self, sqlite_database, mysql_credentials, mocker, caplog
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            chunk=5,
+        )
+        proc._sqlite_cur.execute(
+            'CREATE TABLE "keyset" ("id" INTEGER PRIMARY KEY, "name" TEXT)'
+        )
+        rows = [(key, str(key)) for key in range(1, 13)]
+        # the connection is lost while reading the second page
+        cursor = FakeKeysetMySQLCursor(rows, lose_connection_at=2)
+        mocker.patch.object(proc, "_mysql_cur", cursor)
+        reconnect = mocker.patch.object(proc._mysql, "reconnect", return_value=True)
+        caplog.set_level(logging.DEBUG)
+
+        proc._sqlite_cur.execute("BEGIN")
+        proc._transfer_table_data(
+            "keyset",
+            'INSERT OR IGNORE INTO "keyset" ("id", "name") VALUES (?, ?)',
+            primary_key="id",
+        )
+        proc._sqlite.commit()
+
+        reconnect.assert_called_once()
+        # reading resumed after the first page rather than from the start
+        assert cursor.params == [(5,), (5, 5), (5, 5), (10, 5)]
+        assert (
+            proc._sqlite_cur.execute('SELECT * FROM "keyset" ORDER BY "id"').fetchall()
+            == rows
+        )
+
+
+@pytest.mark.transfer
+@pytest.mark.usefixtures("mysql_instance")
+class TestMySQLtoSQLiteInsertRows:
+    @pytest.fixture
+    def proc(self, sqlite_database, mysql_credentials, mocker):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+        sqlite_cnx = sqlite3.connect(":memory:")
+        sqlite_cnx.execute(
+            'CREATE TABLE "bulk" ("id" INTEGER PRIMARY KEY, "name" TEXT)'
+        )
+        mocker.patch.object(proc, "_sqlite_cur", mocker.Mock(wraps=sqlite_cnx.cursor()))
+        return proc
+
+    @pytest.mark.parametrize(
+        "row_count, bulk, bulk_statements, single_rows",
+        [
+            pytest.param(6, True, 2, 0, id="exact multiple of rows per statement"),
+            pytest.param(7, True, 2, 1, id="remainder"),
+            pytest.param(7, False, 0, 7, id="no bulk statement"),
+        ],
+    )
+    def test_insert_rows(self, proc, row_count, bulk, bulk_statements, single_rows):
+        rows = [(key, str(key)) for key in range(1, row_count + 1)]
+        sql = MySQLtoSQLite._build_insert_sql("bulk", ["id", "name"])
+        bulk_sql = (
+            MySQLtoSQLite._build_insert_sql("bulk", ["id", "name"], rows=3)
+            if bulk
+            else None
+        )
+
+        proc._insert_rows(rows, sql, bulk_sql, rows_per_statement=3)
+
+        assert proc._sqlite_cur.execute.call_count == bulk_statements
+        if single_rows:
+            proc._sqlite_cur.executemany.assert_called_once_with(
+                sql, rows[row_count - single_rows :]
+            )
+        else:
+            proc._sqlite_cur.executemany.assert_not_called()
+        assert (
+            proc._sqlite_cur.execute('SELECT * FROM "bulk" ORDER BY "id"').fetchall()
+            == rows
+        )
+
+    def test_insert_rows_ignores_duplicates_within_a_statement(self, proc):
+        sql = MySQLtoSQLite._build_insert_sql("bulk", ["id", "name"])
+        bulk_sql = MySQLtoSQLite._build_insert_sql("bulk", ["id", "name"], rows=3)
+
+        proc._insert_rows(
+            [(1, "first"), (1, "duplicate"), (2, "second")],
+            sql,
+            bulk_sql,
+            rows_per_statement=3,
+        )
+
+        assert proc._sqlite_cur.execute(
+            'SELECT * FROM "bulk" ORDER BY "id"'
+        ).fetchall() == [(1, "first"), (2, "second")]
+
+
+@pytest.mark.transfer
+@pytest.mark.usefixtures("mysql_instance")
+class TestMySQLtoSQLiteChunkPrefetching:
+    @pytest.fixture
+    def proc(self, sqlite_database, mysql_credentials):
+        return MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+        )
+
+    def test_iter_chunks_yields_all_pages(self, proc):
+        pages = [[(1,), (2,)], [(3,)]]
+        assert list(proc._iter_chunks(iter(pages))) == pages
+
+    def test_iter_chunks_reraises_producer_error(self, proc):
+        error = mysql.connector.Error(
+            msg="Error Code: 2000. Unknown MySQL error",
+            errno=errorcode.CR_UNKNOWN_ERROR,
+        )
+
+        def pages():
+            yield [(1,)]
+            raise error
+
+        chunks = proc._iter_chunks(pages())
+        assert next(chunks) == [(1,)]
+        with pytest.raises(mysql.connector.Error) as excinfo:
+            next(chunks)
+        assert excinfo.value is error
+
+    def test_iter_chunks_stops_producer_when_closed_early(self, proc):
+        threads = set(threading.enumerate())
+        produced = count()
+
+        def pages():
+            # endless, so the producer fills the queue and blocks on put
+            while True:
+                yield [(next(produced),)]
+
+        chunks = proc._iter_chunks(pages())
+        assert next(chunks) == [(0,)]
+        chunks.close()
+
+        assert set(threading.enumerate()) == threads
+        assert next(produced) < 10
+
+
+@pytest.mark.transfer
+@pytest.mark.usefixtures("mysql_instance")
+class TestMySQLtoSQLiteTransactionSize:
+    def test_transfer_table_data_commits_by_size(
+        self, sqlite_database, mysql_credentials, mocker
+    ):
+        proc = MySQLtoSQLite(
+            sqlite_file=sqlite_database,
+            mysql_user=mysql_credentials.user,
+            mysql_password=mysql_credentials.password,
+            mysql_database=mysql_credentials.database,
+            mysql_host=mysql_credentials.host,
+            mysql_port=mysql_credentials.port,
+            chunk=50,
+        )
+        proc._sqlite_cur.execute(
+            'CREATE TABLE "sized" ("id" INTEGER PRIMARY KEY, "name" TEXT)'
+        )
+        rows = [(key, "x" * 1024) for key in range(1, 501)]
+
+        class FakeMySQLCursor:
+            description = (
+                ("id", 3, None, None, None, None, 0, 0),
+                ("name", 253, None, None, None, None, 1, 0),
+            )
+
+            def __init__(self):
+                self.offset = 0
+
+            def fetchmany(self, size=1):
+                chunk = rows[self.offset : self.offset + size]
+                self.offset += size
+                return chunk
+
+        mocker.patch.object(proc, "_mysql_cur", FakeMySQLCursor())
+        mocker.patch.object(MySQLtoSQLite, "SQLITE_TRANSACTION_SIZE", 64 * 1024)
+        sqlite_cnx = mocker.patch.object(
+            proc, "_sqlite", mocker.Mock(wraps=proc._sqlite)
+        )
+
+        proc._sqlite_cur.execute("BEGIN")
+        proc._transfer_table_data(
+            "sized", MySQLtoSQLite._build_insert_sql("sized", ["id", "name"])
+        )
+        # the last transaction is committed by the caller
+        assert proc._sqlite.in_transaction
+        proc._sqlite.commit()
+
+        # about 500 KiB were written in transactions bounded to 64 KiB
+        assert sqlite_cnx.commit.call_count > 2
+        with sqlite3.connect(sqlite_database) as reader:
+            assert reader.execute('SELECT COUNT(*) FROM "sized"').fetchone() == (500,)